@@ -1,8 +1,17 @@
 import streamlit as st
 import os
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from azure.core.exceptions import ResourceNotFoundError
+from azure.core.pipeline.transport import RequestsTransport
 from azure.storage.blob import BlobServiceClient, BlobPrefix
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
 import posixpath
+import tempfile
+import time
 
 # Page configuration
 st.set_page_config(
@@ -21,236 +30,340 @@ if 'current_path' not in st.session_state:
     st.session_state.current_path = ''
 if 'show_welcome' not in st.session_state:
     st.session_state.show_welcome = True
-
-# Custom styling
-st.markdown("""
-    <style>
-    /* General text and elements - using CSS variables for theme colors */
-    .element-container, .stMarkdown {
-        color: var(--text-color);
-    }
-
-    /* Base app styling */
-    .stApp {
-        background-color: var(--background-color);
-    }
-
-    /* File browser styling */
-    .file-list-header {
-        font-size: 0.875rem;
-        padding: 0.5rem;
-        border-bottom: 1px solid rgba(128, 128, 128, 0.2);
-    }
-
-    .file-row {
-        padding: 0.5rem;
-        margin: 0;
-        line-height: 1.5;
-        display: flex;
-        align-items: center;
-    }
-
-    .file-row:hover {
-        background-color: rgba(128, 128, 128, 0.1);
-    }
-
-    /* Button styling */
-    .stButton button {
-        width: 100%;
-        text-align: left;
-        padding: 0.5rem !important;
-        line-height: 1.5;
-        border: 1px solid rgba(128, 128, 128, 0.2) !important;
-        background-color: transparent !important;
-    }
-
-    .stButton button:hover {
-        background-color: rgba(128, 128, 128, 0.1) !important;
-    }
-
-    /* Input fields */
-    .stTextInput > div > div > input {
-        border: 1px solid rgba(128, 128, 128, 0.2) !important;
-    }
-
-    /* Navigation */
-    .current-path {
-        padding: 0.5rem;
-        background-color: rgba(128, 128, 128, 0.1);
-        border-radius: 4px;
-        margin-left: 1rem;
-    }
-
-    /* Upload section */
-    .upload-section {
-        padding: 1rem;
-        border-radius: 6px;
-        margin-top: 1rem;
-        border: 2px dashed rgba(128, 128, 128, 0.2);
-    }
-
-    /* Action buttons */
-    .action-button {
-        padding: 0.25rem 0.5rem;
-        border-radius: 4px;
-        cursor: pointer;
-        transition: background-color 0.2s;
-    }
-
-    .action-button:hover {
-        background-color: rgba(128, 128, 128, 0.1);
-    }
-
-    /* File icons */
-    button[key^="dir_"] {
-        color: inherit !important;
-    }
-
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-
-    /* Empty cell styling */
-    .empty-cell {
-        color: rgba(128, 128, 128, 0.6);
-    }
-    </style>
-""", unsafe_allow_html=True)
+if 'dir_cache' not in st.session_state:
+    st.session_state.dir_cache = {}
+if 'download_cache' not in st.session_state:
+    st.session_state.download_cache = {}
+
+# Custom styling, kept in a static file and read once per process —
+# the literal no longer rides along in every script rerun
+@st.cache_resource
+def load_css():
+    with open(os.path.join(os.path.dirname(__file__), "assets", "app.css")) as f:
+        return f.read()
+
+
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def make_clients(account_name, container_name, sas_token_hash, _sas_token):
+    """Build (and cache) the service and container clients for a connection
+
+    Cached across reruns and reconnects so the warm connection pool
+    survives a disconnect/reconnect cycle. Keyed on a hash of the SAS
+    token rather than the token itself so the credential doesn't become a
+    cache key; the underscore-prefixed raw token is excluded from hashing.
+    """
+    account_url = f"https://{account_name}.blob.core.windows.net"
+    # Built once per connection; every blob operation derives from this
+    # client so its HTTP connection pool is reused (no per-op TLS
+    # handshake). The pool is sized to the worst case of concurrent
+    # sockets: 8 upload workers × 4 blocks each, or 16 download range
+    # fetchers, both ≤ 32 (requests defaults to 10 connections).
+    # Retries stay with the Azure pipeline (retry_total
+    # below) rather than doubling up at the adapter level.
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+    blob_service_client = BlobServiceClient(
+        account_url=account_url,
+        credential=_sas_token,
+        # Timeouts must live on the transport: client-level
+        # connection_timeout/read_timeout kwargs are silently dropped
+        # when a pre-built transport is supplied.
+        transport=RequestsTransport(
+            session=session,
+            connection_timeout=20,
+            read_timeout=60
+        ),
+        retry_total=3,
+        retry_connect=2,
+        max_single_get_size=64 * 1024 * 1024,
+        max_chunk_get_size=16 * 1024 * 1024,
+        max_single_put_size=64 * 1024 * 1024,
+        max_block_size=8 * 1024 * 1024
+    )
+    container_client = blob_service_client.get_container_client(container_name)
+    # Probe with a single HEAD-style call instead of a listing, which did
+    # real work server-side on big containers just to check credentials
+    container_client.get_container_properties()
+    return blob_service_client, container_client
 
 
 def validate_container_access(account_name, container_name, sas_token):
-    """Validate Azure credentials by attempting to list blobs in the container"""
+    """Validate Azure credentials and return cached clients for them"""
     try:
-        account_url = f"https://{account_name}.blob.core.windows.net"
-        blob_service_client = BlobServiceClient(account_url=account_url, credential=sas_token)
-        container_client = blob_service_client.get_container_client(container_name)
-        next(container_client.list_blobs(), None)
-        return blob_service_client, container_client
+        sas_token_hash = hashlib.sha256(sas_token.encode()).hexdigest()
+        return make_clients(account_name, container_name, sas_token_hash, sas_token)
     except Exception as e:
         st.error(f"Connection failed: {str(e)}")
         return None, None
 
 
+# Stop listing a single level past this many entries — the table is
+# unusable long before then, and an unbounded flat directory would
+# otherwise materialize an item dict per blob
+MAX_LISTING_ITEMS = 5000
+
+
 def get_directory_contents(container_client, prefix=''):
-    """Get contents of current directory, properly handling the virtual directory structure"""
+    """Get contents of current directory, properly handling the virtual directory structure
+
+    Returns (items, truncated); truncated is True when the listing was
+    capped at MAX_LISTING_ITEMS entries.
+    """
     try:
-        directories = set()
+        directories = []
         files = []
+        truncated = False
 
         # Normalize prefix
         prefix = prefix if prefix.endswith('/') or prefix == '' else prefix + '/'
 
-        # Use include=['metadata', 'timestamps'] to only fetch necessary properties
-        # This significantly reduces data transfer and improves performance
-        blobs = container_client.list_blobs(
+        # Delimiter-based listing: the service groups blobs by '/' and returns
+        # only the immediate children (BlobPrefix entries for virtual
+        # directories), instead of every descendant blob under the prefix
+        # Maximal pages: the UI renders only after the full level is
+        # listed anyway, so fewer page round-trips beat a faster first
+        # page. The iterator follows continuation tokens transparently.
+        # If a future feature needs per-blob metadata/tags/content-type,
+        # add include=['metadata', ...] HERE so the fields ride along in
+        # the paged response — never call get_blob_properties() per item,
+        # which turns one listing into a round-trip per blob
+        pager = container_client.walk_blobs(
             name_starts_with=prefix,
-            include=['metadata']
-        )
-
-        # Process the listing stream
-        for blob in blobs:
-            relative_path = blob.name[len(prefix):] if prefix else blob.name
-            if not relative_path:
-                continue
-
-            # Handle directories
-            if '/' in relative_path:
-                dir_name = relative_path.split('/')[0]
-                dir_path = prefix + dir_name + '/'
-                if dir_path not in directories:
-                    directories.add(dir_path)
-                continue
-
-            # Add files (only in current directory level)
-            files.append({
-                'name': blob.name,
-                'size': blob.size,
-                'last_modified': blob.last_modified
-            })
-
-        # Convert to list format
-        dir_list = [{'name': d, 'is_directory': True} for d in sorted(directories)]
-        file_list = [{**f, 'is_directory': False} for f in sorted(files, key=lambda x: x['name'])]
-
-        return dir_list + file_list
+            delimiter='/',
+            results_per_page=5000
+        ).by_page()
+
+        # Fetch page N+1 in the background while page N is processed, so
+        # the continuation round-trip overlaps the client-side work on
+        # multi-page levels
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            next_page = prefetcher.submit(next, pager, None)
+            while True:
+                page = next_page.result()
+                if page is None or truncated:
+                    break
+                next_page = prefetcher.submit(next, pager, None)
+                # Clamp while appending: results_per_page is a maximum, not
+                # a guarantee, so only a per-item check keeps the listing at
+                # exactly MAX_LISTING_ITEMS across short pages
+                for item in page:
+                    if len(directories) + len(files) >= MAX_LISTING_ITEMS:
+                        truncated = True
+                        break
+                    if isinstance(item, BlobPrefix):
+                        directories.append({
+                            'name': item.name,
+                            'is_directory': True,
+                            'size_str': '',
+                            'modified_str': '-'
+                        })
+                    else:
+                        files.append({
+                            'name': item.name,
+                            'size': item.size,
+                            'last_modified': item.last_modified,
+                            'is_directory': False
+                        })
+
+        # Precompute display strings here so they are built once per fetch
+        # and ride along in the directory cache, instead of being
+        # reformatted on every rerender
+        if files:
+            size_strs = format_sizes(pd.Series([f['size'] for f in files]))
+            modified_strs = pd.to_datetime(
+                pd.Series([f['last_modified'] for f in files]), utc=True
+            ).dt.strftime('%Y-%m-%d %H:%M:%S').fillna('-')
+            for f, size_str, modified_str in zip(files, size_strs, modified_strs):
+                f['size_str'] = size_str
+                f['modified_str'] = modified_str
+
+        # The service returns entries in lexicographic name order and the
+        # loop above partitions that stream without reordering, so both
+        # lists are already sorted — no client-side sort needed
+        return directories + files, truncated
 
     except Exception as e:
         st.error(f"Error listing contents: {str(e)}")
-        return []
+        return [], False
+
+
+# How long a cached directory listing stays fresh. Short enough that
+# changes made outside this session show up on their own, long enough to
+# absorb the rerun storm of normal interaction
+DIR_CACHE_TTL_SECONDS = 30
+
+
+def list_directory(container_client, prefix=''):
+    """Return (items, truncated) from the session cache, fetching on a miss
 
+    Streamlit reruns the whole script on every widget interaction, so
+    without this every click re-issued a listing against the service.
+    Entries expire after DIR_CACHE_TTL_SECONDS; mutating operations
+    (upload/delete) and the Refresh button invalidate them immediately.
+    The truncated flag rides along in the cache so the capped-listing
+    warning survives reruns served from cache, not just the fetch itself.
+    """
+    cache = st.session_state.dir_cache
+    entry = cache.get(prefix)
+    if entry is None or time.monotonic() - entry[0] > DIR_CACHE_TTL_SECONDS:
+        items, truncated = get_directory_contents(container_client, prefix)
+        cache[prefix] = (time.monotonic(), items, truncated)
+    return cache[prefix][1], cache[prefix][2]
 
-def format_size(size_in_bytes):
-    """Format file size to human readable format"""
-    if size_in_bytes is None:
-        return "-"
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_in_bytes < 1024:
-            return f"{size_in_bytes:.1f} {unit}"
-        size_in_bytes /= 1024
-    return f"{size_in_bytes:.1f} PB"
+
+def invalidate_directory_cache(prefix=None):
+    """Drop a single cached directory listing, or all of them"""
+    if prefix is None:
+        st.session_state.dir_cache.clear()
+    else:
+        st.session_state.dir_cache.pop(prefix, None)
+
+
+def format_sizes(sizes):
+    """Format a pandas Series of byte counts to human readable strings
+
+    Computes the unit bucket for the whole column with numpy instead of
+    looping a scalar formatter per row; None (directories) renders as '-'.
+    """
+    units = np.array(['B', 'KB', 'MB', 'GB', 'TB', 'PB'])
+    values = pd.to_numeric(sizes, errors='coerce')
+    exponent = np.clip(
+        (np.log2(values.clip(lower=1).fillna(1)) // 10).astype(int), 0, len(units) - 1)
+    scaled = values / np.power(1024.0, exponent)
+    formatted = scaled.round(1).astype(str) + ' ' + units[exponent]
+    return formatted.where(values.notna(), '-')
 
 
 def upload_files(container_client, files, current_path):
-    """Upload multiple files to Azure Blob Storage"""
-    try:
-        for file in files:
-            blob_name = posixpath.join(current_path, file.name).lstrip('/')
-            container_client.upload_blob(name=blob_name, data=file, overwrite=True)
-            st.success(f"Successfully uploaded {file.name}")
-    except Exception as e:
-        st.error(f"Error uploading files: {str(e)}")
+    """Upload multiple files to Azure Blob Storage in parallel
+
+    Uses a thread pool over the shared sync client rather than the aio
+    client: the cached BlobServiceClient in session_state already reuses
+    its connection pool across operations, and an aiohttp-based client
+    would be bound to an event loop Streamlit's script thread doesn't own.
+    Concurrency is capped by max_workers, mirroring what a semaphore does
+    in the async variant.
+    """
+    def _upload_one(file):
+        blob_name = posixpath.join(current_path, file.name).lstrip('/')
+        # Passing the known length lets the SDK pick the single-PUT vs
+        # staged-block path up front and read the stream in block-sized
+        # slices, instead of buffering to discover the size
+        container_client.upload_blob(
+            name=blob_name,
+            data=file,
+            length=file.size,
+            overwrite=True,
+            max_concurrency=4
+        )
+
+    # Two tuning knobs compose here: max_workers is file-level parallelism
+    # (how many blobs upload at once), max_concurrency above is block-level
+    # parallelism within each large blob. Their product (8 × 4 = 32) must
+    # stay within the connection pool in make_clients, or the overflow
+    # sockets get opened and discarded per request — exactly the TLS churn
+    # the shared pool exists to avoid. The pool is sized to the batch so
+    # a single-file upload doesn't spin up idle workers
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+        futures = {executor.submit(_upload_one, file): file for file in files}
+        for future in as_completed(futures):
+            file = futures[future]
+            try:
+                future.result()
+                st.success(f"Successfully uploaded {file.name}")
+            except Exception as e:
+                st.error(f"Error uploading {file.name}: {str(e)}")
+
+    invalidate_directory_cache(current_path)
 
 
 def download_blob(container_client, blob_name):
-    """Download a blob from Azure Storage with improved error handling and progress"""
+    """Download a blob from Azure Storage with improved error handling"""
     try:
         blob_client = container_client.get_blob_client(blob_name)
-        
-        # First get blob properties to check size
-        properties = blob_client.get_blob_properties()
-        size_mb = properties.size / (1024 * 1024)
-        
-        # Create a progress bar container that we can update
-        progress_container = st.empty()
-        
-        # Download in chunks for all files
-        chunk_size = 1024 * 1024  # 1MB chunks
-        total_chunks = int(properties.size / chunk_size) + 1
-        
-        # Download stream
-        download_stream = blob_client.download_blob()
-        data = bytearray()
-        
-        for i, chunk in enumerate(download_stream.chunks()):
-            data.extend(chunk)
-            # Update progress for files larger than 1MB
-            if size_mb > 1:
-                progress_container.progress(min((i + 1) / total_chunks, 1.0))
-        
-        # Clear the progress bar
-        progress_container.empty()
-        
-        return bytes(data)
+
+        # No progress_hook here: the SDK invokes it from its chunk-downloader
+        # worker threads, which lack a ScriptRunContext, so Streamlit drops
+        # the calls. The caller's st.spinner is the user feedback instead.
+
+        # Parallel ranged GETs: the SDK fans chunk fetches out across
+        # workers and readinto() writes them as they land, instead of the
+        # old ordered chunks() loop that serialized on Python-side copies.
+        # The size comes back with the first ranged response, so no
+        # separate get_blob_properties round-trip is needed.
+        download_stream = blob_client.download_blob(max_concurrency=16)
+
+        # Spool to a temp file so large blobs don't have to fit in RAM:
+        # stays in memory up to 64 MiB, spills to disk beyond that.
+        # st.download_button accepts the file handle directly.
+        spool = tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024)
+        download_stream.readinto(spool)
+
+        spool.seek(0)
+        return spool
             
     except Exception as e:
         st.error(f"Error downloading file: {str(e)}")
         return None
 
 
+# Keep a few recently fetched blobs around so a repeat prepare click on a
+# rerun returns instantly instead of re-downloading
+DOWNLOAD_CACHE_ENTRIES = 4
+
+
+def cached_download(container_client, blob_name):
+    """Serve a server-side download from the session cache, fetching on a miss"""
+    cache = st.session_state.download_cache
+    spool = cache.pop(blob_name, None)
+    if spool is None:
+        spool = download_blob(container_client, blob_name)
+        if spool is None:
+            return None
+        while len(cache) >= DOWNLOAD_CACHE_ENTRIES:
+            cache.pop(next(iter(cache))).close()
+    # (Re)insert last so the dict doubles as LRU order
+    cache[blob_name] = spool
+    spool.seek(0)
+    return spool
+
+
+def blob_download_url(container_client, blob_name):
+    """Build a direct download URL for a blob using the session's SAS token
+
+    The browser fetches straight from Azure, so the bytes never transit the
+    Streamlit server. The app only ever holds the user-supplied SAS token
+    (no account key or user-delegation key), so that token is reused rather
+    than minting a fresh short-lived SAS. The SDK already folds the SAS
+    credential into the client's URL query string, so the client URL is the
+    complete signed link — appending the token again would corrupt the
+    signature.
+    """
+    if not st.session_state.get('sas_token'):
+        return None
+    return container_client.get_blob_client(blob_name).url
+
+
 def show_navigation():
     """Display the navigation bar with path and controls"""
     st.markdown('<div class="navigation-bar">', unsafe_allow_html=True)
     cols = st.columns([1, 6, 1])  # Added a column for refresh button
 
-    # Back button
+    # Back button. The parent listing is almost always still in the
+    # per-prefix cache (we came from there), so going up re-renders
+    # without a network call; a miss falls through to one delimiter
+    # listing of just that level, never a full-container scan
+    # No explicit rerun in these handlers: the navigation bar renders
+    # before the listing, so the path display below and the fragment both
+    # see the updated state in the same (already running) script pass
     with cols[0]:
         if st.session_state.current_path:
             if st.button("← Back"):
-                path_parts = st.session_state.current_path.rstrip('/').split('/')
-                st.session_state.current_path = '/'.join(path_parts[:-1])
-                if st.session_state.current_path:
-                    st.session_state.current_path += '/'
-                st.rerun()
+                parent = posixpath.dirname(st.session_state.current_path.rstrip('/'))
+                st.session_state.current_path = parent + '/' if parent else ''
 
     # Current path display
     with cols[1]:
@@ -263,7 +376,7 @@ def show_navigation():
     # Refresh button
     with cols[2]:
         if st.button("🔄 Refresh"):
-            st.rerun()
+            invalidate_directory_cache()
 
     st.markdown('</div>', unsafe_allow_html=True)
 
@@ -306,6 +419,7 @@ def show_sidebar():
                     if blob_service_client and container_client:
                         st.session_state.blob_service_client = blob_service_client
                         st.session_state.container_client = container_client
+                        st.session_state.sas_token = sas_token
                         st.session_state.connected = True
                         st.session_state.show_welcome = False
                         st.rerun()
@@ -314,8 +428,11 @@ def show_sidebar():
             else:
                 st.session_state.blob_service_client = None
                 st.session_state.container_client = None
+                st.session_state.sas_token = None
                 st.session_state.connected = False
                 st.session_state.current_path = ''
+                st.session_state.dir_cache = {}
+                st.session_state.download_cache = {}
                 st.session_state.show_welcome = True
                 st.rerun()
 
@@ -333,12 +450,47 @@ def delete_blob(container_client, blob_name):
         return False
 
 def delete_directory(container_client, directory_path):
-    """Delete all blobs within a directory"""
+    """Delete all blobs within a directory using batch requests"""
+    # The batch API accepts up to 256 deletes per request
+    batch_size = 256
+    failed = []
+
+    def _delete_batch(names):
+        try:
+            container_client.delete_blobs(*names)
+        except Exception:
+            # A batch can partially fail; retry one-by-one so a single bad
+            # blob doesn't abort the rest of the directory. Names the batch
+            # already deleted come back 404 here — that's success, not a
+            # failure to report
+            for name in names:
+                try:
+                    container_client.delete_blob(name)
+                except ResourceNotFoundError:
+                    pass
+                except Exception:
+                    failed.append(name)
+
     try:
-        # List all blobs in directory
-        blobs = container_client.list_blobs(name_starts_with=directory_path)
-        for blob in blobs:
-            container_client.delete_blob(blob.name)
+        # Batches are dispatched to worker threads as soon as they fill,
+        # so deletes run while the name listing is still streaming in;
+        # leaving the with-block waits for the stragglers
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            batch = []
+            # Only names are needed for deletion; list_blob_names skips
+            # deserializing the full per-blob property set
+            for name in container_client.list_blob_names(name_starts_with=directory_path,
+                                                         results_per_page=5000):
+                batch.append(name)
+                if len(batch) == batch_size:
+                    executor.submit(_delete_batch, batch)
+                    batch = []
+            if batch:
+                executor.submit(_delete_batch, batch)
+
+        if failed:
+            st.error(f"Failed to delete {len(failed)} item(s), e.g. {failed[0]}")
+            return False
         return True
     except Exception as e:
         st.error(f"Error deleting directory: {str(e)}")
@@ -347,6 +499,113 @@ def delete_directory(container_client, directory_path):
 
 
 
+@st.dialog("Confirm delete")
+def confirm_delete(item):
+    """Modal confirmation for deletes; only the dialog reruns while open"""
+    display_name = posixpath.basename(item['name'].rstrip('/'))
+    kind = "directory" if item['is_directory'] else "file"
+    st.write(f"Delete {kind} **{display_name}**? This cannot be undone.")
+    cols = st.columns(2)
+    if cols[0].button("Delete", type="primary", key="confirm_delete_yes"):
+        if item['is_directory']:
+            if delete_directory(st.session_state.container_client, item['name']):
+                invalidate_directory_cache()
+                st.rerun()
+        else:
+            if delete_blob(st.session_state.container_client, item['name']):
+                invalidate_directory_cache(st.session_state.current_path)
+                # Close the evicted spool so its file descriptor (and any
+                # on-disk spill) is released now, not at GC time
+                spool = st.session_state.download_cache.pop(item['name'], None)
+                if spool:
+                    spool.close()
+                st.rerun()
+    if cols[1].button("Cancel", key="confirm_delete_no"):
+        st.rerun()
+
+
+@st.fragment
+def show_file_listing():
+    """Render the listing and its action panel as a fragment
+
+    Interactions inside this region (row selection, the download
+    prepare/save pair, delete confirmation) rerun only the fragment, so
+    the rest of the script doesn't re-execute on every click. Navigation
+    and Refresh live outside and still trigger full reruns.
+    """
+    items, truncated = list_directory(st.session_state.container_client,
+                                      st.session_state.current_path)
+
+    # Rendered on every pass, not just the fetch, so the warning stays up
+    # as long as the capped listing does — including fragment reruns
+    # served from the directory cache
+    if truncated:
+        st.warning(
+            f"Showing only the first {MAX_LISTING_ITEMS} entries of this "
+            f"directory; narrow down via a subdirectory to see the rest.")
+
+    if items:
+        # A single dataframe renders all rows in one widget, instead of a
+        # per-row pile of columns/buttons that Streamlit re-registers on
+        # every rerun
+        # Computed once per listing and reused by the action panel below;
+        # size/modified strings were precomputed when the listing was
+        # fetched and cached
+        display_names = [posixpath.basename(item['name'].rstrip('/')) for item in items]
+        df = pd.DataFrame({
+            'Name': [('📁 ' if item['is_directory'] else '📄 ') + n
+                     for item, n in zip(items, display_names)],
+            'Size': [item['size_str'] for item in items],
+            'Last Modified': [item['modified_str'] for item in items],
+        })
+        # The key carries the current path: Streamlit identifies the
+        # widget by key alone, so a static key would keep the previous
+        # directory's row selection alive after navigation and bind the
+        # action panel to the wrong item
+        event = st.dataframe(
+            df,
+            hide_index=True,
+            use_container_width=True,
+            on_select='rerun',
+            selection_mode='single-row',
+            key=f"file_listing_{st.session_state.current_path}"
+        )
+
+        # Action panel for the selected row; the bounds check guards
+        # against any stale selection outliving the listing it indexed
+        selected_rows = event.selection.rows
+        if selected_rows and selected_rows[0] < len(items):
+            item = items[selected_rows[0]]
+            display_name = display_names[selected_rows[0]]
+            action_cols = st.columns([1, 1, 5])
+
+            if item['is_directory']:
+                if action_cols[0].button("📂 Open", key="open_selected"):
+                    st.session_state.current_path = item['name']
+                    st.rerun()
+            else:
+                with action_cols[0]:
+                    url = blob_download_url(st.session_state.container_client, item['name'])
+                    if url:
+                        # Browser downloads directly from Azure — no bytes
+                        # buffered on the Streamlit server
+                        st.link_button("⬇️ Download", url)
+                    elif st.button("⬇️ Download", key="download_selected"):
+                        with st.spinner('Preparing download...'):
+                            blob_data = cached_download(st.session_state.container_client, item['name'])
+                            if blob_data:
+                                st.download_button(
+                                    label="💾 Save",
+                                    data=blob_data,
+                                    file_name=display_name,
+                                    key="save_selected"
+                                )
+
+            with action_cols[1]:
+                if st.button("🗑️ Delete", key="delete_selected"):
+                    confirm_delete(item)
+
+
 def show_file_browser():
     """Display the file browser interface"""
     st.title("Azure Blob Storage Explorer")
@@ -357,77 +616,7 @@ def show_file_browser():
     # File browser section
     st.markdown('<div class="file-browser">', unsafe_allow_html=True)
 
-    # List contents
-    items = get_directory_contents(st.session_state.container_client, st.session_state.current_path)
-
-    if items:
-        # Headers
-        cols = st.columns([3, 2, 2, 1])
-        cols[0].markdown('<div class="file-list-header">Name</div>', unsafe_allow_html=True)
-        cols[1].markdown('<div class="file-list-header">Size</div>', unsafe_allow_html=True)
-        cols[2].markdown('<div class="file-list-header">Last Modified</div>', unsafe_allow_html=True)
-        cols[3].markdown('<div class="file-list-header">Actions</div>', unsafe_allow_html=True)
-
-        for item in items:
-            display_name = item['name'].rstrip('/').split('/')[-1]
-            cols = st.columns([3, 2, 2, 1])
-
-            # Name column
-            with cols[0]:
-                if item['is_directory']:
-                    if st.button(f"📁 {display_name}", key=f"dir_{item['name']}"):
-                        st.session_state.current_path = item['name']
-                        st.rerun()
-                else:
-                    st.markdown(f"<div class='file-row'>📄 {display_name}</div>", unsafe_allow_html=True)
-
-            # Size and modification date
-            cols[1].markdown(f'<div class="file-row">{format_size(item.get("size", None))}</div>',
-                             unsafe_allow_html=True)
-            cols[2].markdown(
-                f'<div class="file-row">{item.get("last_modified", "-").strftime("%Y-%m-%d %H:%M:%S") if item.get("last_modified") else "-"}</div>',
-                unsafe_allow_html=True
-            )
-
-            # Actions column
-            with cols[3]:
-               action_cols = st.columns([1, 1])
-               if not item['is_directory']:
-                   with action_cols[0]:
-                       # Prepare download button
-                       if st.button("⬇️", key=f"download_btn_{item['name']}", help="Prepare download"):
-                           with st.spinner('Preparing download...'):
-                               blob_data = download_blob(st.session_state.container_client, item['name'])
-                               if blob_data:
-                                   # Show save button once data is ready
-                                   st.download_button(
-                                       label="💾",
-                                       data=blob_data,
-                                       file_name=display_name,
-                                       key=f"download_{item['name']}", 
-                                       help="Save file"
-                                   )
-                   
-                   # Delete button
-                   with action_cols[1]:
-                       if st.button("🗑️", key=f"delete_{item['name']}", 
-                                   help="Delete" + (" directory" if item['is_directory'] else " file")):
-                           if st.session_state.get(f"confirm_delete_{item['name']}", False):
-                               # Perform deletion
-                               if item['is_directory']:
-                                   if delete_directory(st.session_state.container_client, item['name']):
-                                       st.success(f"Directory {display_name} deleted successfully")
-                                       st.rerun()
-                               else:
-                                   if delete_blob(st.session_state.container_client, item['name']):
-                                       st.success(f"File {display_name} deleted successfully")
-                                       st.rerun()
-                           else:
-                               # Show confirmation
-                               st.session_state[f"confirm_delete_{item['name']}"] = True
-                               st.warning(f"You sure?")
-
-
+    show_file_listing()
 
     # Upload section
     st.markdown('<div class="upload-section">', unsafe_allow_html=True)